@@ -19,6 +19,9 @@ class Settings(BaseSettings):
     API_PORT: int = 8000
     DEBUG: bool = True
 
+    # Response cache: max serialized GET responses kept in memory (0 disables)
+    RESPONSE_CACHE_SIZE: int = 256
+
     # CORS
     ALLOWED_ORIGINS: Union[str, List[str]] = "http://localhost:3000,http://localhost:5173"
 
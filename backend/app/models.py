@@ -61,3 +61,20 @@ class Candidate(Base):
 
     # Relationships
     job = relationship("Job", back_populates="candidates")
+
+
+class JobStat(Base):
+    """Incrementally maintained per-job pipeline counter (see services/stats_service.py)"""
+    __tablename__ = "job_stats"
+
+    job_id = Column(Integer, ForeignKey("jobs.id"), primary_key=True)
+    metric = Column(String(64), primary_key=True)  # total, scored, unscored, score_sum, status:<s>, score_bucket:<n>
+    value = Column(Float, nullable=False, default=0)
+
+
+class CacheVersion(Base):
+    """Change counter for a cacheable scope of data (see services/cache_service.py)"""
+    __tablename__ = "cache_versions"
+
+    scope = Column(String(100), primary_key=True)  # jobs (list), job:<job_id>, candidates:<job_id>
+    version = Column(Integer, nullable=False, default=0)
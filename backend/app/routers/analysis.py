@@ -24,16 +24,8 @@ async def analyze_candidate_match(request: AnalyzeRequest, db: Session = Depends
     if not job:
         raise HTTPException(status_code=404, detail="Associated job not found")
 
-    # Perform AI analysis
-    analysis_result = await analyze_candidate(candidate, job)
-
-    # Update candidate with analysis results
-    candidate.match_score = analysis_result["match_score"]
-    candidate.analysis = analysis_result["analysis"]
-    candidate.strengths = analysis_result["strengths"]
-    candidate.concerns = analysis_result["concerns"]
-
-    db.commit()
+    # Perform AI analysis (stores the results on the candidate)
+    await analyze_candidate(candidate, job)
     db.refresh(candidate)
 
     return {
@@ -62,18 +54,24 @@ async def batch_analyze_candidates(job_id: int, db: Session = Depends(get_db)):
 
     results = []
     for candidate in candidates:
+        # Skip candidates scored by a single /analyze call since the batch started
+        db.refresh(candidate)
+        if candidate.match_score is not None:
+            results.append({
+                "candidate_id": candidate.id,
+                "name": candidate.name,
+                "match_score": candidate.match_score,
+                "status": "skipped"
+            })
+            continue
+
         try:
             analysis_result = await analyze_candidate(candidate, job)
 
-            candidate.match_score = analysis_result["match_score"]
-            candidate.analysis = analysis_result["analysis"]
-            candidate.strengths = analysis_result["strengths"]
-            candidate.concerns = analysis_result["concerns"]
-
             results.append({
                 "candidate_id": candidate.id,
                 "name": candidate.name,
-                "match_score": candidate.match_score,
+                "match_score": analysis_result["match_score"],
                 "status": "success"
             })
         except Exception as e:
@@ -84,8 +82,6 @@ async def batch_analyze_candidates(job_id: int, db: Session = Depends(get_db)):
                 "error": str(e)
             })
 
-    db.commit()
-
     return {
         "job_id": job_id,
         "total_analyzed": len(results),
@@ -1,12 +1,18 @@
 """Candidate management API endpoints"""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.database import get_db
 from app.models import Candidate, Job
-from app.schemas import CandidateCreate, CandidateResponse, CandidateUpdate
+from app.schemas import CandidateCreate, CandidateResponse, CandidateUpdate, CandidateSearchResult
+from app.services.cache_service import cached_json_response, candidates_scope
+from app.services.export_service import (
+    DEFAULT_EXPORT_COLUMNS, EXPORT_COLUMNS, EXPORT_FORMATS, stream_candidates_export
+)
+from app.services.search_service import search_candidates
 
 router = APIRouter()
 
@@ -46,24 +52,77 @@ async def create_candidate(candidate: CandidateCreate, db: Session = Depends(get
 @router.get("/job/{job_id}", response_model=List[CandidateResponse])
 def get_candidates_for_job(
     job_id: int,
+    request: Request,
     status: Optional[str] = None,
     min_score: Optional[float] = None,
     db: Session = Depends(get_db)
 ):
     """Get all candidates for a specific job with optional filtering"""
 
-    query = db.query(Candidate).filter(Candidate.job_id == job_id)
+    def build():
+        query = db.query(Candidate).filter(Candidate.job_id == job_id)
 
-    if status:
-        query = query.filter(Candidate.status == status)
+        if status:
+            query = query.filter(Candidate.status == status)
 
-    if min_score is not None:
-        query = query.filter(Candidate.match_score >= min_score)
+        if min_score is not None:
+            query = query.filter(Candidate.match_score >= min_score)
 
-    # Order by match score descending (best matches first)
-    candidates = query.order_by(Candidate.match_score.desc()).all()
+        # Order by match score descending (best matches first)
+        candidates = query.order_by(Candidate.match_score.desc()).all()
 
-    return candidates
+        return [CandidateResponse.model_validate(candidate) for candidate in candidates]
+
+    return cached_json_response(request, db, [candidates_scope(job_id)], build)
+
+
+@router.get("/job/{job_id}/export")
+def export_candidates_for_job(
+    job_id: int,
+    format: str = "csv",
+    columns: Optional[str] = None,
+    status: Optional[str] = None,
+    min_score: Optional[float] = None,
+    db: Session = Depends(get_db)
+):
+    """Stream a job's candidates and analyses as CSV or NDJSON"""
+
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported format. Use one of: {', '.join(EXPORT_FORMATS)}"
+        )
+
+    selected = [c.strip() for c in columns.split(",") if c.strip()] if columns else DEFAULT_EXPORT_COLUMNS
+    unknown = [c for c in selected if c not in EXPORT_COLUMNS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown columns: {', '.join(unknown)}")
+
+    # Verify job exists
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return StreamingResponse(
+        stream_candidates_export(job_id, format, selected, status=status, min_score=min_score),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="job-{job_id}-candidates.{format}"'}
+    )
+
+
+@router.get("/search", response_model=List[CandidateSearchResult])
+def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    job_id: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    """Full-text search candidates by name, title, company, skills and notes"""
+    try:
+        return search_candidates(db, q, job_id=job_id, limit=limit, offset=offset)
+    except NotImplementedError as e:
+        raise HTTPException(status_code=501, detail=str(e))
 
 
 @router.get("/{candidate_id}", response_model=CandidateResponse)
@@ -1,13 +1,15 @@
 """Job management API endpoints"""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import List
 
 from app.database import get_db
 from app.models import Job
-from app.schemas import JobCreate, JobResponse
+from app.schemas import JobCreate, JobResponse, JobStatsResponse
 from app.services.ai_service import extract_job_requirements
+from app.services.cache_service import JOBS_SCOPE, cached_json_response, job_scope
+from app.services.stats_service import get_job_stats
 
 router = APIRouter()
 
@@ -37,19 +39,49 @@ async def create_job(job: JobCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=List[JobResponse])
-def get_jobs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_jobs(request: Request, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     """Get all job postings"""
-    jobs = db.query(Job).offset(skip).limit(limit).all()
-    return jobs
+
+    def build():
+        jobs = db.query(Job).offset(skip).limit(limit).all()
+        return [JobResponse.model_validate(job) for job in jobs]
+
+    return cached_json_response(request, db, [JOBS_SCOPE], build)
+
+
+@router.get("/stats", response_model=List[JobStatsResponse])
+def get_jobs_stats(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+    """Get pipeline statistics for the same page of jobs as the job list"""
+    job_ids = [job_id for (job_id,) in db.query(Job.id).offset(skip).limit(limit)]
+    try:
+        return list(get_job_stats(db, job_ids).values())
+    except NotImplementedError as e:
+        raise HTTPException(status_code=501, detail=str(e))
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-def get_job(job_id: int, db: Session = Depends(get_db)):
+def get_job(job_id: int, request: Request, db: Session = Depends(get_db)):
     """Get a specific job by ID"""
+
+    def build():
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return JobResponse.model_validate(job)
+
+    return cached_json_response(request, db, [job_scope(job_id)], build)
+
+
+@router.get("/{job_id}/stats", response_model=JobStatsResponse)
+def get_job_stats_for_job(job_id: int, db: Session = Depends(get_db)):
+    """Get candidate counts by status, score histogram and average score for a job"""
     job = db.query(Job).filter(Job.id == job_id).first()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job
+    try:
+        return get_job_stats(db, [job_id])[job_id]
+    except NotImplementedError as e:
+        raise HTTPException(status_code=501, detail=str(e))
 
 
 @router.delete("/{job_id}")
@@ -29,6 +29,16 @@ class JobResponse(JobBase):
         from_attributes = True
 
 
+class JobStatsResponse(BaseModel):
+    job_id: int
+    total_candidates: int
+    scored_candidates: int
+    unscored_candidates: int
+    average_score: Optional[float] = None
+    status_counts: Dict[str, int]
+    score_histogram: List[int]  # Candidate counts per 10-point score bucket, 0-9 through 90-100
+
+
 # Candidate Schemas
 class CandidateBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
@@ -74,6 +84,18 @@ class CandidateUpdate(BaseModel):
     notes: Optional[str] = None
 
 
+class CandidateSearchResult(BaseModel):
+    id: int
+    job_id: int
+    name: str
+    current_title: Optional[str] = None
+    current_company: Optional[str] = None
+    status: Optional[str] = None
+    match_score: Optional[float] = None
+    rank: float
+    snippet: Optional[str] = None
+
+
 # Analysis Schemas
 class AnalyzeRequest(BaseModel):
     candidate_id: int
@@ -1,10 +1,13 @@
 """AI service for candidate analysis using Anthropic Claude API"""
 
+import asyncio
+import hashlib
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Awaitable, Callable, Hashable
 from anthropic import Anthropic
 
 from app.config import settings
+from app.database import SessionLocal
 from app.models import Candidate, Job
 
 
@@ -19,6 +22,42 @@ if settings.ANTHROPIC_API_KEY and settings.ANTHROPIC_API_KEY != "your_api_key_he
         client = None
 
 
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key into one in-flight task
+
+    Callers that arrive while a task for their key is running await that
+    task's result (or exception) instead of starting their own. The key is
+    released as soon as the task finishes, so later calls run fresh.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._release(key, done))
+        # Shield so one caller disconnecting doesn't cancel the call for everyone else
+        return await asyncio.shield(future)
+
+    def _release(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            future.exception()  # Mark as retrieved even if every waiter went away
+
+
+_requirements_flight = SingleFlight()
+_analysis_flight = SingleFlight()
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
 async def extract_job_requirements(job_description: str) -> Dict[str, Any]:
     """
     Extract structured requirements from a job description using AI
@@ -55,8 +94,14 @@ Job Description:
 
 Return only valid JSON, no additional text."""
 
+    # Identical descriptions submitted concurrently share one API call
+    return await _requirements_flight.do(_digest(prompt), lambda: _request_job_requirements(prompt))
+
+
+async def _request_job_requirements(prompt: str) -> Dict[str, Any]:
     try:
-        message = client.messages.create(
+        message = await asyncio.to_thread(
+            client.messages.create,
             model="claude-3-5-sonnet-20240620",
             max_tokens=2000,
             messages=[
@@ -76,7 +121,11 @@ Return only valid JSON, no additional text."""
 
 async def analyze_candidate(candidate: Candidate, job: Job) -> Dict[str, Any]:
     """
-    Analyze a candidate's fit for a job using AI
+    Analyze a candidate's fit for a job using AI and store the results on the candidate
+
+    Concurrent calls for the same candidate and job content share one API
+    call and one database write; callers should refresh their own copy of
+    the candidate rather than writing the results themselves.
 
     Args:
         candidate: Candidate object with profile data
@@ -123,8 +172,39 @@ Provide a detailed analysis in JSON format with:
 
 Be thorough but concise. Return only valid JSON."""
 
+    # The prompt covers the job's description/requirements and the candidate's profile,
+    # so its digest acts as the (candidate, job version) key: a double-clicked analyze
+    # or one overlapping a batch run awaits the leader's call and its single write
+    key = (candidate.id, job.id, _digest(prompt))
+    return await _analysis_flight.do(key, lambda: _analyze_and_store(candidate.id, prompt))
+
+
+async def _analyze_and_store(candidate_id: int, prompt: str) -> Dict[str, Any]:
+    result = await _request_candidate_analysis(prompt)
+    _store_candidate_analysis(candidate_id, result)
+    return result
+
+
+def _store_candidate_analysis(candidate_id: int, result: Dict[str, Any]) -> None:
+    # Own session: the shared task may outlive the request that started it
+    db = SessionLocal()
     try:
-        message = client.messages.create(
+        candidate = db.get(Candidate, candidate_id)
+        if candidate is None:
+            return
+        candidate.match_score = result["match_score"]
+        candidate.analysis = result["analysis"]
+        candidate.strengths = result["strengths"]
+        candidate.concerns = result["concerns"]
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _request_candidate_analysis(prompt: str) -> Dict[str, Any]:
+    try:
+        message = await asyncio.to_thread(
+            client.messages.create,
             model="claude-3-5-sonnet-20240620",
             max_tokens=3000,
             messages=[
@@ -0,0 +1,165 @@
+"""Version-based ETags and an in-process response cache for read endpoints"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import CacheVersion, Candidate, Job
+
+
+JOBS_SCOPE = "jobs"
+
+BUMP_VERSION = text(
+    """INSERT INTO cache_versions (scope, version) VALUES (:scope, 1)
+    ON CONFLICT (scope) DO UPDATE SET version = cache_versions.version + 1"""
+)
+
+
+def job_scope(job_id: int) -> str:
+    """Scope covering one job's own fields"""
+    return f"job:{job_id}"
+
+
+def candidates_scope(job_id: int) -> str:
+    """Scope covering the candidate list of one job"""
+    return f"candidates:{job_id}"
+
+
+def _changed_scopes(session: Session) -> Set[str]:
+    scopes = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        if isinstance(obj, Job):
+            scopes.add(JOBS_SCOPE)
+            if obj.id is not None:
+                scopes.add(job_scope(obj.id))
+        elif isinstance(obj, Candidate):
+            history = inspect(obj).attrs.job_id.history
+            for job_id in [obj.job_id, *history.deleted]:
+                if job_id is not None:
+                    scopes.add(candidates_scope(job_id))
+    return scopes
+
+
+@event.listens_for(SessionLocal, "before_flush")
+def _bump_versions(session: Session, flush_context, instances) -> None:
+    """Bump the change counter of every scope touched by this flush, in the same transaction"""
+    scopes = _changed_scopes(session)
+    if not scopes:
+        return
+    session.connection().execute(BUMP_VERSION, [{"scope": scope} for scope in sorted(scopes)])
+    session.info.setdefault("bumped_scopes", set()).update(scopes)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    response_cache.invalidate(session.info.pop("bumped_scopes", set()))
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop("bumped_scopes", None)
+
+
+class ResponseCache:
+    """Thread-safe LRU of serialized responses, keyed by request and tagged with their scopes"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[str, bytes, Set[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, etag: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != etag:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, etag: str, body: bytes, scopes: Iterable[str]) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (etag, body, set(scopes))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, scopes: Set[str]) -> None:
+        """Drop entries that depend on any of the given scopes"""
+        if not scopes:
+            return
+        with self._lock:
+            stale = [key for key, (_, _, deps) in self._entries.items() if deps & scopes]
+            for key in stale:
+                del self._entries[key]
+
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_SIZE)
+
+
+def get_versions(db: Session, scopes: List[str]) -> Dict[str, int]:
+    """Read the current change counters for scopes (0 for scopes never written)"""
+    rows = db.query(CacheVersion.scope, CacheVersion.version).filter(CacheVersion.scope.in_(scopes))
+    versions = dict.fromkeys(scopes, 0)
+    versions.update(dict(rows))
+    return versions
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+def cached_json_response(
+    request: Request,
+    db: Session,
+    scopes: List[str],
+    build: Callable[[], Any]
+) -> Response:
+    """
+    Serve a JSON GET response with a version-based ETag
+
+    The ETag is derived from the request URL and the change counters of the
+    scopes the response depends on, so it can be checked without loading the
+    underlying rows. Counters are read before the data is built, which means
+    a concurrent write can only make the body newer than its tag, never older.
+
+    Args:
+        request: Incoming request (URL and If-None-Match header)
+        db: Database session
+        scopes: Cache scopes the response depends on
+        build: Produces the response payload on a cache miss
+
+    Returns:
+        304 if the client's copy is current, otherwise the JSON body with its ETag
+    """
+    key = f"{request.url.path}?{request.url.query}"
+    versions = get_versions(db, scopes)
+    digest = hashlib.sha1(json.dumps([key, versions], sort_keys=True).encode()).hexdigest()
+    etag = f'"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    body = response_cache.get(key, etag)
+    if body is None:
+        body = json.dumps(jsonable_encoder(build())).encode()
+        response_cache.put(key, etag, body, scopes)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,147 @@
+"""Streaming CSV/NDJSON export of candidates and their AI analyses"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy import select
+
+from app.database import SessionLocal
+from app.models import Candidate
+
+
+EXPORT_BATCH_SIZE = 500  # Rows fetched per cursor round-trip and written per chunk
+LIST_SEPARATOR = "; "  # How list fields are flattened into a single CSV cell
+
+# Leading characters spreadsheets treat as a formula; such text cells get a ' prefix
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _analysis_field(key: str) -> Callable[[Dict[str, Any]], Any]:
+    return lambda row: (row["analysis"] or {}).get(key)
+
+
+# Exportable columns: plain candidate columns, plus fields pulled out of the analysis JSON
+CANDIDATE_COLUMNS = [
+    "id", "job_id", "name", "email", "linkedin_url", "current_title", "current_company",
+    "location", "skills", "match_score", "strengths", "concerns", "source", "status",
+    "notes", "created_at", "updated_at",
+]
+ANALYSIS_COLUMNS = {
+    "summary": _analysis_field("summary"),
+    "recommendation": _analysis_field("recommendation"),
+    "skill_match": _analysis_field("skill_match"),
+    "experience_match": _analysis_field("experience_match"),
+    "next_steps": _analysis_field("next_steps"),
+}
+EXPORT_COLUMNS = CANDIDATE_COLUMNS + list(ANALYSIS_COLUMNS)
+
+DEFAULT_EXPORT_COLUMNS = [
+    "id", "name", "email", "current_title", "current_company", "location", "status",
+    "match_score", "recommendation", "summary", "strengths", "concerns",
+]
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _iter_rows(
+    job_id: int,
+    columns: List[str],
+    status: Optional[str],
+    min_score: Optional[float]
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield batches of export rows read through a server-side cursor"""
+    needed = [name for name in CANDIDATE_COLUMNS if name in columns]
+    if any(name in ANALYSIS_COLUMNS for name in columns):
+        needed.append("analysis")
+
+    # Select plain columns rather than ORM objects so rows are never held in the identity map
+    query = select(*[getattr(Candidate, name) for name in needed]).where(Candidate.job_id == job_id)
+    if status:
+        query = query.where(Candidate.status == status)
+    if min_score is not None:
+        query = query.where(Candidate.match_score >= min_score)
+    query = query.order_by(Candidate.match_score.desc(), Candidate.id)
+
+    # The response outlives the request's session, so the stream owns its own
+    db = SessionLocal()
+    try:
+        result = db.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE)).mappings()
+        for partition in result.partitions():
+            yield [
+                {
+                    name: ANALYSIS_COLUMNS[name](row) if name in ANALYSIS_COLUMNS else row[name]
+                    for name in columns
+                }
+                for row in partition
+            ]
+    finally:
+        db.close()
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, list):
+        value = LIST_SEPARATOR.join(str(item) for item in value)
+    elif isinstance(value, dict):
+        value = json.dumps(value)
+    elif isinstance(value, datetime):
+        return value.isoformat()
+
+    # Candidate and AI text ends up in Excel; neutralize anything it would evaluate
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def stream_candidates_export(
+    job_id: int,
+    export_format: str = "csv",
+    columns: Optional[List[str]] = None,
+    status: Optional[str] = None,
+    min_score: Optional[float] = None
+) -> Iterator[str]:
+    """
+    Stream a job's candidates as CSV or NDJSON in constant memory
+
+    Args:
+        job_id: Job whose candidates to export
+        export_format: "csv" or "ndjson"
+        columns: Columns to include, in order (DEFAULT_EXPORT_COLUMNS if None)
+        status: Only export candidates with this status
+        min_score: Only export candidates scoring at least this much
+
+    Returns:
+        Iterator of text chunks, one per batch of rows
+    """
+    columns = columns or DEFAULT_EXPORT_COLUMNS
+    batches = _iter_rows(job_id, columns, status, min_score)
+
+    if export_format == "ndjson":
+        for batch in batches:
+            yield "".join(json.dumps(row, default=_json_default) + "\n" for row in batch)
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for batch in batches:
+        for row in batch:
+            writer.writerow([_csv_value(row[name]) for name in columns])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    # Header only, for jobs with no matching candidates
+    if buffer.tell():
+        yield buffer.getvalue()
@@ -0,0 +1,248 @@
+"""Full-text candidate search backed by SQLite FTS5 or PostgreSQL tsvector"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+
+SNIPPET_START = "<mark>"
+SNIPPET_END = "</mark>"
+
+
+# SQLite: external-content FTS5 table over `candidates`, kept in sync by triggers
+SQLITE_SEARCH_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS candidates_fts USING fts5(
+        name, current_title, current_company, skills, notes,
+        content='candidates', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS candidates_fts_insert AFTER INSERT ON candidates BEGIN
+        INSERT INTO candidates_fts(rowid, name, current_title, current_company, skills, notes)
+        VALUES (new.id, new.name, new.current_title, new.current_company, new.skills, new.notes);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS candidates_fts_delete AFTER DELETE ON candidates BEGIN
+        INSERT INTO candidates_fts(candidates_fts, rowid, name, current_title, current_company, skills, notes)
+        VALUES ('delete', old.id, old.name, old.current_title, old.current_company, old.skills, old.notes);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS candidates_fts_update
+    AFTER UPDATE OF name, current_title, current_company, skills, notes ON candidates BEGIN
+        INSERT INTO candidates_fts(candidates_fts, rowid, name, current_title, current_company, skills, notes)
+        VALUES ('delete', old.id, old.name, old.current_title, old.current_company, old.skills, old.notes);
+        INSERT INTO candidates_fts(rowid, name, current_title, current_company, skills, notes)
+        VALUES (new.id, new.name, new.current_title, new.current_company, new.skills, new.notes);
+    END""",
+]
+
+
+# Bump when candidate_search_document changes so existing rows are re-indexed on startup
+POSTGRES_SEARCH_VERSION = "2"
+
+# PostgreSQL: side table holding a weighted tsvector per candidate, kept in sync by a trigger
+POSTGRES_SEARCH_DDL = [
+    """CREATE TABLE IF NOT EXISTS candidate_search (
+        candidate_id INTEGER PRIMARY KEY REFERENCES candidates(id) ON DELETE CASCADE,
+        document TSVECTOR NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS ix_candidate_search_document ON candidate_search USING GIN (document)",
+    # Every column is indexed under both configs: 'simple' keeps names and stopwords verbatim,
+    # 'english' adds stems, so either form of a query term finds the row
+    """CREATE OR REPLACE FUNCTION candidate_search_terms(value text, weight "char") RETURNS tsvector AS $$
+        SELECT setweight(
+            to_tsvector('simple', coalesce(value, '')) || to_tsvector('english', coalesce(value, '')),
+            weight
+        )
+    $$ LANGUAGE sql IMMUTABLE""",
+    """CREATE OR REPLACE FUNCTION candidate_search_document(c candidates) RETURNS tsvector AS $$
+        SELECT candidate_search_terms(c.name, 'A')
+            || candidate_search_terms(c.current_title, 'B')
+            || candidate_search_terms(c.current_company, 'B')
+            || candidate_search_terms(c.skills::text, 'B')
+            || candidate_search_terms(c.notes, 'C')
+    $$ LANGUAGE sql IMMUTABLE""",
+    """CREATE OR REPLACE FUNCTION candidate_search_sync() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO candidate_search (candidate_id, document)
+        VALUES (NEW.id, candidate_search_document(NEW))
+        ON CONFLICT (candidate_id) DO UPDATE SET document = EXCLUDED.document;
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql""",
+    "DROP TRIGGER IF EXISTS candidate_search_sync ON candidates",
+    """CREATE TRIGGER candidate_search_sync
+    AFTER INSERT OR UPDATE OF name, current_title, current_company, skills, notes ON candidates
+    FOR EACH ROW EXECUTE FUNCTION candidate_search_sync()""",
+]
+
+
+def init_search_index(engine: Engine) -> None:
+    """
+    Create the candidate search index and its sync triggers if missing
+
+    Existing candidates are indexed the first time the index is created, so
+    this is safe to call on every startup.
+
+    Args:
+        engine: SQLAlchemy engine the application is bound to
+    """
+    with engine.begin() as conn:
+        if conn.dialect.name == "sqlite":
+            _init_sqlite(conn)
+        elif conn.dialect.name == "postgresql":
+            _init_postgres(conn)
+
+
+def _init_sqlite(conn: Connection) -> None:
+    exists = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'candidates_fts'")
+    ).first()
+
+    for statement in SQLITE_SEARCH_DDL:
+        conn.execute(text(statement))
+
+    if not exists:
+        conn.execute(text("INSERT INTO candidates_fts(candidates_fts) VALUES ('rebuild')"))
+
+
+def _init_postgres(conn: Connection) -> None:
+    for statement in POSTGRES_SEARCH_DDL:
+        conn.execute(text(statement))
+
+    # The index version lives in the table comment; only a new or outdated index is rebuilt
+    version = conn.execute(
+        text("SELECT obj_description('candidate_search'::regclass, 'pg_class')")
+    ).scalar()
+    if version == f"v{POSTGRES_SEARCH_VERSION}":
+        return
+
+    conn.execute(text(
+        """INSERT INTO candidate_search (candidate_id, document)
+        SELECT c.id, candidate_search_document(c) FROM candidates c
+        ON CONFLICT (candidate_id) DO UPDATE SET document = EXCLUDED.document"""
+    ))
+    conn.execute(text(f"COMMENT ON TABLE candidate_search IS 'v{POSTGRES_SEARCH_VERSION}'"))
+
+
+def _tsquery_expression(query: str) -> Optional[str]:
+    """Turn free text into to_tsquery input: every term ANDed, the last one as a prefix"""
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        return None
+    quoted = [f"'{term}'" for term in terms]
+    quoted[-1] += ":*"
+    return " & ".join(quoted)
+
+
+def _fts5_match_expression(query: str) -> Optional[str]:
+    """Turn free text into an FTS5 expression: every term quoted, the last one as a prefix"""
+    terms = [term.replace('"', '""') for term in query.split()]
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def search_candidates(
+    db: Session,
+    query: str,
+    job_id: Optional[int] = None,
+    limit: int = 20,
+    offset: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Ranked full-text search over candidates
+
+    Args:
+        db: Database session
+        query: Free-text search terms
+        job_id: Restrict results to one job (all jobs if None)
+        limit: Maximum number of results
+        offset: Number of results to skip
+
+    Returns:
+        Matching candidates, best match first, each with a highlighted snippet
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        return _search_sqlite(db, query, job_id, limit, offset)
+    if dialect == "postgresql":
+        return _search_postgres(db, query, job_id, limit, offset)
+    raise NotImplementedError(f"Full-text search is not supported on {dialect}")
+
+
+def _search_sqlite(
+    db: Session, query: str, job_id: Optional[int], limit: int, offset: int
+) -> List[Dict[str, Any]]:
+    match = _fts5_match_expression(query)
+    if match is None:
+        return []
+
+    # bm25() is lower-is-better; column weights favour name and title hits over notes
+    sql = """
+        SELECT c.id, c.job_id, c.name, c.current_title, c.current_company,
+               c.status, c.match_score,
+               -bm25(candidates_fts, 10.0, 5.0, 3.0, 3.0, 1.0) AS rank,
+               snippet(candidates_fts, -1, :start, :end, '…', 12) AS snippet
+        FROM candidates_fts
+        JOIN candidates c ON c.id = candidates_fts.rowid
+        WHERE candidates_fts MATCH :match
+    """
+    params: Dict[str, Any] = {
+        "match": match,
+        "start": SNIPPET_START,
+        "end": SNIPPET_END,
+        "limit": limit,
+        "offset": offset,
+    }
+    if job_id is not None:
+        sql += " AND c.job_id = :job_id"
+        params["job_id"] = job_id
+    sql += " ORDER BY bm25(candidates_fts, 10.0, 5.0, 3.0, 3.0, 1.0) LIMIT :limit OFFSET :offset"
+
+    return [dict(row) for row in db.execute(text(sql), params).mappings()]
+
+
+def _search_postgres(
+    db: Session, query: str, job_id: Optional[int], limit: int, offset: int
+) -> List[Dict[str, Any]]:
+    tsquery = _tsquery_expression(query)
+    if tsquery is None:
+        return []
+
+    # Match on either config, mirroring how the document is indexed (see candidate_search_terms).
+    # Rank inside the subquery so ts_headline only runs on the returned page
+    sql = """
+        WITH q AS (
+            SELECT to_tsquery('simple', :query) || to_tsquery('english', :query) AS query
+        ),
+        hits AS (
+            SELECT s.candidate_id, ts_rank_cd(s.document, q.query) AS rank
+            FROM candidate_search s, q
+            WHERE s.document @@ q.query
+    """
+    params: Dict[str, Any] = {
+        "query": tsquery,
+        "limit": limit,
+        "offset": offset,
+        "options": f"StartSel={SNIPPET_START}, StopSel={SNIPPET_END}, MaxWords=24, MinWords=8",
+    }
+    if job_id is not None:
+        sql += " AND s.candidate_id IN (SELECT id FROM candidates WHERE job_id = :job_id)"
+        params["job_id"] = job_id
+    sql += """
+            ORDER BY rank DESC
+            LIMIT :limit OFFSET :offset
+        )
+        SELECT c.id, c.job_id, c.name, c.current_title, c.current_company,
+               c.status, c.match_score, hits.rank,
+               ts_headline('english', concat_ws(' … ', c.name, c.current_title,
+                   c.current_company, c.skills::text, c.notes), q.query, :options) AS snippet
+        FROM hits
+        JOIN candidates c ON c.id = hits.candidate_id, q
+        ORDER BY hits.rank DESC
+    """
+
+    return [dict(row) for row in db.execute(text(sql), params).mappings()]
@@ -0,0 +1,239 @@
+"""Per-job pipeline statistics maintained incrementally by triggers on candidate writes"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import Candidate, JobStat
+
+
+SCORE_BUCKETS = 10  # 0-9, 10-19, ..., 90-100
+SUPPORTED_DIALECTS = ("sqlite", "postgresql")  # Databases the maintenance triggers exist for
+DEFAULT_STATUS = "new"
+
+UPSERT_STAT = text(
+    """INSERT INTO job_stats (job_id, metric, value) VALUES (:job_id, :metric, :value)
+    ON CONFLICT (job_id, metric) DO UPDATE SET value = job_stats.value + excluded.value"""
+)
+
+Deltas = Dict[Tuple[int, str], float]
+
+
+def _score_bucket(score: float) -> int:
+    return min(max(int(score // (100 / SCORE_BUCKETS)), 0), SCORE_BUCKETS - 1)
+
+
+def _contribute(deltas: Deltas, job_id: Optional[int], status: Optional[str],
+                score: Optional[float], weight: int) -> None:
+    """Add (weight > 0) or remove (weight < 0) `weight` candidates' contribution to a job's counters
+
+    Used for full rebuilds; _contribution_sql is the trigger-side equivalent.
+    """
+    if job_id is None:
+        return
+    deltas[(job_id, "total")] += weight
+    deltas[(job_id, f"status:{status or DEFAULT_STATUS}")] += weight
+    if score is None:
+        deltas[(job_id, "unscored")] += weight
+    else:
+        deltas[(job_id, "scored")] += weight
+        deltas[(job_id, "score_sum")] += weight * score
+        deltas[(job_id, f"score_bucket:{_score_bucket(score)}")] += weight
+
+
+def _contribution_sql(row: str, sign: int, bucket_sql: str) -> str:
+    """SELECT rows of (job_id, metric, value) for one candidate row (NEW or OLD), mirroring _contribute"""
+    bucket = bucket_sql.format(score=f"{row}.match_score")
+    return f"""
+        SELECT {row}.job_id AS job_id, 'total' AS metric, {sign} AS value
+        UNION ALL SELECT {row}.job_id, 'status:' || coalesce({row}.status, '{DEFAULT_STATUS}'), {sign}
+        UNION ALL SELECT {row}.job_id,
+            CASE WHEN {row}.match_score IS NULL THEN 'unscored' ELSE 'scored' END, {sign}
+        UNION ALL SELECT {row}.job_id, 'score_sum', {sign} * {row}.match_score
+            WHERE {row}.match_score IS NOT NULL
+        UNION ALL SELECT {row}.job_id, 'score_bucket:' || {bucket}, {sign}
+            WHERE {row}.match_score IS NOT NULL"""
+
+
+def _apply_sql(rows: List[Tuple[str, int]], bucket_sql: str) -> str:
+    """Upsert-increment job_stats by the net contribution of the given trigger rows"""
+    contributions = " UNION ALL ".join(_contribution_sql(row, sign, bucket_sql) for row, sign in rows)
+    return f"""INSERT INTO job_stats (job_id, metric, value)
+        SELECT job_id, metric, sum(value) FROM ({contributions}) AS delta
+        GROUP BY job_id, metric
+        HAVING sum(value) <> 0
+        ON CONFLICT (job_id, metric) DO UPDATE SET value = job_stats.value + excluded.value"""
+
+
+# Triggers compute deltas from the rows actually in the database, so overlapping writers
+# and ORM instances that never loaded the old values can't skew the counters
+SQLITE_BUCKET = f"min(max(CAST({{score}} / {100 // SCORE_BUCKETS} AS INTEGER), 0), {SCORE_BUCKETS - 1})"
+SQLITE_STATS_DDL = [
+    f"""CREATE TRIGGER IF NOT EXISTS job_stats_candidate_insert AFTER INSERT ON candidates BEGIN
+        {_apply_sql([("new", 1)], SQLITE_BUCKET)};
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS job_stats_candidate_delete AFTER DELETE ON candidates BEGIN
+        {_apply_sql([("old", -1)], SQLITE_BUCKET)};
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS job_stats_candidate_update
+    AFTER UPDATE OF job_id, status, match_score ON candidates BEGIN
+        {_apply_sql([("old", -1), ("new", 1)], SQLITE_BUCKET)};
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS job_stats_job_delete BEFORE DELETE ON jobs BEGIN
+        DELETE FROM job_stats WHERE job_id = old.id;
+    END""",
+]
+
+POSTGRES_BUCKET = f"least(greatest(floor({{score}} / {100 // SCORE_BUCKETS})::int, 0), {SCORE_BUCKETS - 1})"
+POSTGRES_STATS_DDL = [
+    f"""CREATE OR REPLACE FUNCTION job_stats_candidate_sync() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            {_apply_sql([("NEW", 1)], POSTGRES_BUCKET)};
+        ELSIF TG_OP = 'DELETE' THEN
+            {_apply_sql([("OLD", -1)], POSTGRES_BUCKET)};
+        ELSE
+            {_apply_sql([("OLD", -1), ("NEW", 1)], POSTGRES_BUCKET)};
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql""",
+    "DROP TRIGGER IF EXISTS job_stats_candidate_sync ON candidates",
+    """CREATE TRIGGER job_stats_candidate_sync
+    AFTER INSERT OR DELETE OR UPDATE OF job_id, status, match_score ON candidates
+    FOR EACH ROW EXECUTE FUNCTION job_stats_candidate_sync()""",
+    """CREATE OR REPLACE FUNCTION job_stats_job_delete() RETURNS trigger AS $$
+    BEGIN
+        DELETE FROM job_stats WHERE job_id = OLD.id;
+        RETURN OLD;
+    END
+    $$ LANGUAGE plpgsql""",
+    "DROP TRIGGER IF EXISTS job_stats_job_delete ON jobs",
+    """CREATE TRIGGER job_stats_job_delete BEFORE DELETE ON jobs
+    FOR EACH ROW EXECUTE FUNCTION job_stats_job_delete()""",
+]
+
+
+def rebuild_job_stats(db: Session, job_ids: Optional[Iterable[int]] = None) -> None:
+    """
+    Recompute job_stats from the candidates table
+
+    Args:
+        db: Database session
+        job_ids: Jobs to rebuild (all jobs if None)
+    """
+    query = db.query(
+        Candidate.job_id, Candidate.status, Candidate.match_score, func.count()
+    ).group_by(Candidate.job_id, Candidate.status, Candidate.match_score)
+    delete = JobStat.__table__.delete()
+    if job_ids is not None:
+        job_ids = list(job_ids)
+        query = query.filter(Candidate.job_id.in_(job_ids))
+        delete = delete.where(JobStat.job_id.in_(job_ids))
+
+    deltas: Deltas = defaultdict(float)
+    for job_id, status, score, count in query:
+        _contribute(deltas, job_id, status, score, count)
+
+    conn = db.connection()
+    conn.execute(delete)
+    if deltas:
+        conn.execute(UPSERT_STAT, [
+            {"job_id": job_id, "metric": metric, "value": value}
+            for (job_id, metric), value in deltas.items()
+        ])
+    db.commit()
+
+
+def init_job_stats(engine: Engine) -> None:
+    """
+    Create the triggers that maintain job_stats
+
+    job_stats is rebuilt from candidates whenever the triggers are newly
+    installed, so counters are correct on first start against existing data.
+    On other databases nothing is installed and get_job_stats is unavailable.
+
+    Args:
+        engine: SQLAlchemy engine the application is bound to
+    """
+    if engine.dialect.name not in SUPPORTED_DIALECTS:
+        return
+
+    with engine.begin() as conn:
+        dialect = conn.dialect.name
+        if dialect == "sqlite":
+            installed = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'job_stats_candidate_update'"
+            )).first()
+            ddl = SQLITE_STATS_DDL
+        elif dialect == "postgresql":
+            installed = conn.execute(text(
+                "SELECT 1 FROM pg_trigger WHERE tgname = 'job_stats_candidate_sync'"
+            )).first()
+            ddl = POSTGRES_STATS_DDL
+        for statement in ddl:
+            conn.execute(text(statement))
+
+    if not installed:
+        db = SessionLocal(bind=engine)
+        try:
+            rebuild_job_stats(db)
+        finally:
+            db.close()
+
+
+def get_job_stats(db: Session, job_ids: Optional[Iterable[int]] = None) -> Dict[int, Dict[str, Any]]:
+    """
+    Read pipeline statistics for jobs in a single query
+
+    Args:
+        db: Database session
+        job_ids: Jobs to read (all jobs with candidates if None)
+
+    Returns:
+        Mapping of job_id to stats: candidate counts by status, score histogram,
+        average score and number of unscored candidates
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect not in SUPPORTED_DIALECTS:
+        raise NotImplementedError(f"Job statistics are not supported on {dialect}")
+
+    query = db.query(JobStat.job_id, JobStat.metric, JobStat.value)
+    if job_ids is not None:
+        job_ids = list(job_ids)
+        query = query.filter(JobStat.job_id.in_(job_ids))
+
+    counters: Dict[int, Dict[str, float]] = defaultdict(dict)
+    for job_id, metric, value in query:
+        counters[job_id][metric] = value
+
+    return {
+        job_id: _format_stats(job_id, counters.get(job_id, {}))
+        for job_id in (job_ids if job_ids is not None else counters)
+    }
+
+
+def _format_stats(job_id: int, counters: Dict[str, float]) -> Dict[str, Any]:
+    scored = int(counters.get("scored", 0))
+    histogram = [0] * SCORE_BUCKETS
+    status_counts = {}
+    for metric, value in counters.items():
+        kind, _, key = metric.partition(":")
+        if kind == "status" and value:
+            status_counts[key] = int(value)
+        elif kind == "score_bucket":
+            histogram[int(key)] = int(value)
+
+    return {
+        "job_id": job_id,
+        "total_candidates": int(counters.get("total", 0)),
+        "scored_candidates": scored,
+        "unscored_candidates": int(counters.get("unscored", 0)),
+        "average_score": round(counters.get("score_sum", 0) / scored, 2) if scored else None,
+        "status_counts": status_counts,
+        "score_histogram": histogram,
+    }
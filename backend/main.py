@@ -11,6 +11,8 @@ import uvicorn
 from app.config import settings
 from app.database import engine, Base
 from app.routers import jobs, candidates, analysis
+from app.services.search_service import init_search_index
+from app.services.stats_service import init_job_stats
 
 
 @asynccontextmanager
@@ -18,6 +20,8 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup: Create database tables
     Base.metadata.create_all(bind=engine)
+    init_search_index(engine)
+    init_job_stats(engine)
     yield
     # Shutdown: cleanup if needed
 
@@ -0,0 +1,41 @@
+"""Shared fixtures: the app running against a throwaway SQLite database"""
+
+import os
+import tempfile
+
+import pytest
+
+# Must be set before anything imports app.config / app.database
+_db_dir = tempfile.mkdtemp(prefix="bazilisk-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ["ANTHROPIC_API_KEY"] = ""
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def job(client):
+    response = client.post("/api/jobs/", json={
+        "title": "Backend Engineer",
+        "company": "Acme",
+        "description": "Build APIs in Python"
+    })
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.fixture
+def add_candidate(client, job):
+    def add(**fields):
+        response = client.post("/api/candidates/", json={"job_id": job["id"], **fields})
+        assert response.status_code == 201
+        return response.json()
+    return add
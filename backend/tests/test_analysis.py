@@ -0,0 +1,108 @@
+"""Tests for single-flight candidate analysis"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.services import ai_service
+from main import app
+
+
+class FakeMessages:
+    """Stands in for the Anthropic client: slow, and counts its calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.slow_names = set()
+
+    def create(self, **kwargs):
+        self.calls += 1
+        prompt = kwargs["messages"][0]["content"]
+        slow = any(f'"name": "{name}"' in prompt for name in self.slow_names)
+        time.sleep(0.6 if slow else 0.2)
+        text = json.dumps({"match_score": 85, "strengths": ["Python"], "concerns": []})
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+@pytest.fixture
+def fake_ai(monkeypatch):
+    messages = FakeMessages()
+    monkeypatch.setattr(ai_service, "client", SimpleNamespace(messages=messages))
+
+    writes = []
+    store = ai_service._store_candidate_analysis
+
+    def counting_store(candidate_id, result):
+        writes.append(candidate_id)
+        store(candidate_id, result)
+
+    monkeypatch.setattr(ai_service, "_store_candidate_analysis", counting_store)
+    return SimpleNamespace(messages=messages, writes=writes)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_analyze_makes_one_call_and_one_write(client, job, add_candidate, fake_ai):
+    candidate = add_candidate(name="A", skills=["Python"])
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        responses = await asyncio.gather(*[
+            http.post("/api/analysis/analyze", json={"candidate_id": candidate["id"]})
+            for _ in range(2)
+        ])
+
+    assert [r.status_code for r in responses] == [200, 200]
+    assert [r.json()["match_score"] for r in responses] == [85, 85]
+    assert fake_ai.messages.calls == 1
+    assert fake_ai.writes == [candidate["id"]]
+
+    stats = client.get(f"/api/jobs/{job['id']}/stats").json()
+    assert stats["scored_candidates"] == 1
+    assert stats["unscored_candidates"] == 0
+
+
+@pytest.mark.asyncio
+async def test_analyze_overlapping_batch_shares_the_call(client, job, add_candidate, fake_ai):
+    candidate = add_candidate(name="A", skills=["Go"])
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        batch, single = await asyncio.gather(
+            http.post(f"/api/analysis/batch-analyze/{job['id']}"),
+            http.post("/api/analysis/analyze", json={"candidate_id": candidate["id"]}),
+        )
+
+    assert batch.json()["results"][0]["match_score"] == single.json()["match_score"] == 85
+    assert fake_ai.messages.calls == 1
+    assert fake_ai.writes == [candidate["id"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_candidates_scored_meanwhile_as_skipped(client, job, add_candidate, fake_ai):
+    first = add_candidate(name="Slow")
+    second = add_candidate(name="B")
+    fake_ai.messages.slow_names.add("Slow")
+
+    # Score the second candidate while the batch is still busy with the first
+    async def analyze_second_soon(http):
+        await asyncio.sleep(0.05)
+        return await http.post("/api/analysis/analyze", json={"candidate_id": second["id"]})
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        batch, _ = await asyncio.gather(
+            http.post(f"/api/analysis/batch-analyze/{job['id']}"),
+            analyze_second_soon(http),
+        )
+
+    body = batch.json()
+    assert body["total_analyzed"] == 2
+    assert {r["candidate_id"]: r["status"] for r in body["results"]} == {
+        first["id"]: "success",
+        second["id"]: "skipped",
+    }
+    assert fake_ai.messages.calls == 2
@@ -0,0 +1,130 @@
+"""Tests for ETag conditional GETs and the response cache"""
+
+import pytest
+
+from app.database import SessionLocal
+from app.models import Candidate
+from app.services import ai_service
+from app.services.cache_service import candidates_scope, get_versions, response_cache
+
+
+def _candidates_url(job):
+    return f"/api/candidates/job/{job['id']}"
+
+
+def _revalidate(client, url, etag):
+    return client.get(url, headers={"If-None-Match": etag})
+
+
+@pytest.fixture(params=[256, 0], ids=["cache", "no-cache"])
+def cache_size(request, monkeypatch):
+    monkeypatch.setattr(response_cache, "max_size", request.param)
+    return request.param
+
+
+def test_matching_etag_returns_empty_304(client, job, add_candidate):
+    add_candidate(name="A")
+    first = client.get(_candidates_url(job))
+
+    repeat = _revalidate(client, _candidates_url(job), first.headers["etag"])
+
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["etag"] == first.headers["etag"]
+
+
+def test_weak_and_wildcard_if_none_match(client, job):
+    etag = client.get(_candidates_url(job)).headers["etag"]
+
+    assert _revalidate(client, _candidates_url(job), f'"other", W/{etag}').status_code == 304
+    assert _revalidate(client, _candidates_url(job), "*").status_code == 304
+    assert _revalidate(client, _candidates_url(job), '"other"').status_code == 200
+
+
+def test_patch_changes_etag_and_body(client, job, add_candidate, cache_size):
+    candidate = add_candidate(name="A")
+    etag = client.get(_candidates_url(job)).headers["etag"]
+
+    client.patch(f"/api/candidates/{candidate['id']}", json={"status": "contacted"})
+    response = _revalidate(client, _candidates_url(job), etag)
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert [c["status"] for c in response.json()] == ["contacted"]
+
+
+def test_delete_changes_etag_and_body(client, job, add_candidate, cache_size):
+    candidate = add_candidate(name="A")
+    etag = client.get(_candidates_url(job)).headers["etag"]
+
+    client.delete(f"/api/candidates/{candidate['id']}")
+    response = _revalidate(client, _candidates_url(job), etag)
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json() == []
+
+
+def test_stored_analysis_changes_etag_and_body(client, job, add_candidate, cache_size):
+    candidate = add_candidate(name="A")
+    etag = client.get(_candidates_url(job)).headers["etag"]
+
+    ai_service._store_candidate_analysis(candidate["id"], {
+        "match_score": 77, "analysis": {}, "strengths": ["Go"], "concerns": []
+    })
+    response = _revalidate(client, _candidates_url(job), etag)
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert [c["match_score"] for c in response.json()] == [77]
+
+
+def test_rolled_back_write_keeps_version(client, job, add_candidate):
+    candidate = add_candidate(name="A")
+    etag = client.get(_candidates_url(job)).headers["etag"]
+    scope = candidates_scope(job["id"])
+
+    db = SessionLocal()
+    try:
+        before = get_versions(db, [scope])
+        db.get(Candidate, candidate["id"]).notes = "never committed"
+        db.flush()
+        db.rollback()
+        assert get_versions(db, [scope]) == before
+    finally:
+        db.close()
+
+    assert _revalidate(client, _candidates_url(job), etag).status_code == 304
+
+
+def test_disabled_cache_stores_nothing(client, job, add_candidate, monkeypatch):
+    monkeypatch.setattr(response_cache, "max_size", 0)
+    monkeypatch.setattr(response_cache, "_entries", type(response_cache._entries)())
+    add_candidate(name="A")
+
+    response = client.get(_candidates_url(job))
+
+    assert [c["name"] for c in response.json()] == ["A"]
+    assert len(response_cache._entries) == 0
+
+
+def test_job_detail_is_scoped_to_its_own_job(client, job):
+    url = f"/api/jobs/{job['id']}"
+    job_etag = client.get(url).headers["etag"]
+    list_etag = client.get("/api/jobs/").headers["etag"]
+
+    client.post("/api/jobs/", json={"title": "Other", "company": "Acme", "description": "Other role"})
+
+    assert _revalidate(client, url, job_etag).status_code == 304
+    assert _revalidate(client, "/api/jobs/", list_etag).status_code == 200
+
+
+def test_missing_job_is_not_cached(client):
+    url = "/api/jobs/999999"
+
+    response = client.get(url)
+
+    assert response.status_code == 404
+    assert "etag" not in response.headers
+    assert f"{url}?" not in response_cache._entries
+    assert client.get(url).status_code == 404
@@ -0,0 +1,53 @@
+"""Tests for streaming candidate export"""
+
+import csv
+import io
+import json
+
+from app.database import SessionLocal
+from app.models import Candidate
+
+
+def test_csv_flattens_lists_and_neutralizes_formulas(client, job, add_candidate):
+    candidate = add_candidate(name="=HYPERLINK(\"http://evil\")", current_title="-2+3")
+    db = SessionLocal()
+    try:
+        row = db.get(Candidate, candidate["id"])
+        row.match_score = -1
+        row.strengths = ["@SUM(A1)", "Python"]
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.get(
+        f"/api/candidates/job/{job['id']}/export",
+        params={"columns": "name,current_title,match_score,strengths"}
+    )
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+
+    assert rows == [{
+        "name": "'=HYPERLINK(\"http://evil\")",
+        "current_title": "'-2+3",
+        "match_score": "-1.0",
+        "strengths": "'@SUM(A1); Python",
+    }]
+
+
+def test_ndjson_keeps_raw_values(client, job, add_candidate):
+    add_candidate(name="=1+1", skills=["Go", "Rust"])
+
+    response = client.get(
+        f"/api/candidates/job/{job['id']}/export",
+        params={"format": "ndjson", "columns": "name,skills"}
+    )
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"name": "=1+1", "skills": ["Go", "Rust"]}
+    ]
+
+
+def test_unknown_columns_are_rejected(client, job):
+    response = client.get(f"/api/candidates/job/{job['id']}/export", params={"columns": "id,password"})
+
+    assert response.status_code == 400
@@ -0,0 +1,39 @@
+"""Tests for candidate full-text search"""
+
+from app.services.search_service import _fts5_match_expression, _tsquery_expression
+
+
+def test_search_matches_names_and_prefixes(client, job, add_candidate):
+    jones = add_candidate(name="Alex Jones", current_title="Senior Python Engineer")
+    add_candidate(name="Sam Williams", current_title="Designer")
+
+    results = client.get("/api/candidates/search", params={"q": "jones pyth", "job_id": job["id"]}).json()
+
+    assert [r["id"] for r in results] == [jones["id"]]
+    assert "<mark>" in results[0]["snippet"]
+
+
+def test_search_follows_updates(client, job, add_candidate):
+    candidate = add_candidate(name="Robin Lee")
+    client.patch(f"/api/candidates/{candidate['id']}", json={"notes": "kubernetes expert"})
+
+    results = client.get("/api/candidates/search", params={"q": "kubernetes", "job_id": job["id"]}).json()
+
+    assert [r["id"] for r in results] == [candidate["id"]]
+
+
+def test_query_expressions_quote_terms_and_prefix_last():
+    assert _fts5_match_expression('jo"nes pyth') == '"jo""nes" "pyth"*'
+    assert _tsquery_expression("Jones, pyth!") == "'Jones' & 'pyth':*"
+    assert _tsquery_expression("  ") is None
+
+
+def test_unsupported_database_returns_501(client, monkeypatch):
+    def unsupported(*args, **kwargs):
+        raise NotImplementedError("Full-text search is not supported on mysql")
+
+    monkeypatch.setattr("app.routers.candidates.search_candidates", unsupported)
+
+    response = client.get("/api/candidates/search", params={"q": "jones"})
+
+    assert response.status_code == 501
@@ -0,0 +1,98 @@
+"""Tests for incrementally maintained job statistics"""
+
+from types import SimpleNamespace
+
+from app.database import SessionLocal
+from app.models import Candidate
+from app.services.stats_service import get_job_stats, init_job_stats, rebuild_job_stats
+
+
+def _stats(client, job):
+    return client.get(f"/api/jobs/{job['id']}/stats").json()
+
+
+def test_stats_follow_create_update_delete(client, job, add_candidate):
+    first = add_candidate(name="A")
+    second = add_candidate(name="B")
+    client.patch(f"/api/candidates/{first['id']}", json={"status": "contacted"})
+    client.delete(f"/api/candidates/{second['id']}")
+
+    stats = _stats(client, job)
+
+    assert stats["total_candidates"] == 1
+    assert stats["unscored_candidates"] == 1
+    assert stats["status_counts"] == {"contacted": 1}
+
+
+def test_overlapping_analysis_writes_count_once(client, job, add_candidate):
+    candidate = add_candidate(name="A")
+
+    # Two sessions load the same unscored candidate, as two overlapping /analyze calls would
+    first, second = SessionLocal(), SessionLocal()
+    try:
+        for db in (first, second):
+            db.get(Candidate, candidate["id"]).match_score = 85
+        first.commit()
+        second.commit()
+    finally:
+        first.close()
+        second.close()
+
+    stats = _stats(client, job)
+
+    assert stats["scored_candidates"] == 1
+    assert stats["unscored_candidates"] == 0
+    assert stats["score_histogram"][8] == 1
+    assert stats["average_score"] == 85
+
+
+def test_writes_to_expired_instances_are_counted(client, job, add_candidate):
+    candidate = add_candidate(name="A")
+
+    db = SessionLocal()
+    try:
+        row = db.get(Candidate, candidate["id"])
+        row.match_score = 80
+        db.commit()  # Expires the instance, so the next sets have no attribute history
+        row.match_score = 55
+        row.status = "contacted"
+        db.commit()
+    finally:
+        db.close()
+
+    stats = _stats(client, job)
+
+    assert stats["score_histogram"][5] == 1
+    assert stats["score_histogram"][8] == 0
+    assert stats["average_score"] == 55
+    assert stats["status_counts"] == {"contacted": 1}
+
+
+def test_incremental_stats_match_rebuild(client, job, add_candidate):
+    for score in (None, 12.5, 71, 100):
+        candidate = add_candidate(name="A")
+        if score is not None:
+            db = SessionLocal()
+            try:
+                db.get(Candidate, candidate["id"]).match_score = score
+                db.commit()
+            finally:
+                db.close()
+
+    db = SessionLocal()
+    try:
+        incremental = get_job_stats(db, [job["id"]])
+        rebuild_job_stats(db, [job["id"]])
+        assert get_job_stats(db, [job["id"]]) == incremental
+    finally:
+        db.close()
+
+
+def test_unsupported_database_skips_triggers_and_returns_501(client, job, monkeypatch):
+    # A bare stand-in engine: any attempt to connect and install triggers would raise
+    init_job_stats(SimpleNamespace(dialect=SimpleNamespace(name="mysql")))
+
+    monkeypatch.setattr("app.services.stats_service.SUPPORTED_DIALECTS", ())
+
+    assert client.get(f"/api/jobs/{job['id']}/stats").status_code == 501
+    assert client.get("/api/jobs/stats").status_code == 501
@@ -13,6 +13,8 @@ const apiClient = axios.create({
 export const jobsApi = {
   getAll: () => apiClient.get('/api/jobs'),
   getById: (id) => apiClient.get(`/api/jobs/${id}`),
+  getStats: (params = {}) => apiClient.get('/api/jobs/stats', { params }),
+  getStatsById: (id) => apiClient.get(`/api/jobs/${id}/stats`),
   create: (data) => apiClient.post('/api/jobs', data),
   delete: (id) => apiClient.delete(`/api/jobs/${id}`),
 }
@@ -22,7 +24,11 @@ export const candidatesApi = {
   create: (data) => apiClient.post('/api/candidates', data),
   getByJobId: (jobId, params = {}) =>
     apiClient.get(`/api/candidates/job/${jobId}`, { params }),
+  exportUrl: (jobId, params = {}) =>
+    `${API_BASE_URL}/api/candidates/job/${jobId}/export?${new URLSearchParams(params)}`,
   getById: (id) => apiClient.get(`/api/candidates/${id}`),
+  search: (q, params = {}) =>
+    apiClient.get('/api/candidates/search', { params: { q, ...params } }),
   update: (id, data) => apiClient.patch(`/api/candidates/${id}`, data),
   delete: (id) => apiClient.delete(`/api/candidates/${id}`),
 }